@@ -2,26 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import os
+import time
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException, Request
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import BaseModel
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
+from app.clients.llm_interface import LLMClient
 from app.clients.provider_selector import prompting_client
+from app.core.concurrency import run_llm
 from app.core.config import settings
+from app.core.linefile import count_lines
 from app.core.locations import get_all_locations, get_location_by_id
-from app.core.logging import log, truncate_log_file
+from app.core.logging import TRUNCATE_THRESHOLD, log, tail_lines, truncate_log_file
 from app.core.paths import get_data_path
+from app.core.prompt_storage import (
+    MAX_PROMPTS,
+    append_prompt_bundles,
+    find_prompt_bundle,
+    get_prompt_state,
+    load_prompt_index,
+    prompts_etag,
+)
+from app.core.prompt_storage import update_prompt_state as save_prompt_state
+from app.core.prompt_storage import update_prompt_states as save_prompt_states
+from app.core.ratelimit import rate_limit
 
 router = APIRouter()
 
-# Rate limiter instance
-limiter = Limiter(key_func=get_remote_address)
-
-
 # ============================================================================
 # Prompt Bundle Endpoints (Manual Workflow)
 # ============================================================================
@@ -47,9 +59,69 @@ class PromptBundleRequest(BaseModel):
     single_accessory: bool = True  # If True, bind exactly 1 accessory; if False, bind 2
 
 
-@router.post("/prompts/bundle")
-@limiter.limit("10/minute")
-async def generate_prompt_bundle(request: Request) -> dict:
+# Generic social meta used when generation fails; tuples keep the template
+# immutable, so each fallback gets fresh lists built from it
+_FALLBACK_SOCIAL_META = {
+    "title": "Fitness Inspiration",
+    "caption": "strong, calm and focused 💪",
+    "tags": ("fitness", "workout", "motivation"),
+    "hashtags": ("#fitness", "#workout", "#motivation"),
+}
+
+
+def _social_meta_or_fallback(llm: LLMClient, bundle: dict, setting_label: str) -> dict:
+    """Generate social metadata for one bundle, falling back to generic copy on failure.
+
+    Args:
+        llm: LLM client from prompting_client()
+        bundle: Generated prompt bundle
+        setting_label: Location display label
+
+    Returns:
+        Social meta dict (title, caption, tags, hashtags)
+    """
+    try:
+        media_meta = {
+            "bundle_id": bundle["id"],
+            "setting": setting_label,
+            "image_prompt": bundle["image_prompt"]["final_prompt"][:200],
+            "video_motion": bundle["video_prompt"].get("motion", "")[:100],
+        }
+        return llm.generate_social_meta(media_meta)
+    except Exception as e:
+        log.warning(f"SOCIAL_META_GENERATION_FAILED bundle_id={bundle['id']}: {e}")
+        # Provide fallback social meta (fresh lists; bundles are stored and returned)
+        return {
+            "title": _FALLBACK_SOCIAL_META["title"],
+            "caption": _FALLBACK_SOCIAL_META["caption"],
+            "tags": list(_FALLBACK_SOCIAL_META["tags"]),
+            "hashtags": list(_FALLBACK_SOCIAL_META["hashtags"]),
+        }
+
+
+async def _generate_social_metas(
+    llm: LLMClient, bundles: list[dict], setting_label: str
+) -> list[dict]:
+    """Generate social metadata for all bundles concurrently.
+
+    Calls go through the process-wide LLM limiter (run_llm), shared with
+    bundle generation and other requests.
+
+    Args:
+        llm: LLM client from prompting_client()
+        bundles: Generated prompt bundles
+        setting_label: Location display label
+
+    Returns:
+        Social meta dicts in the same order as bundles
+    """
+    return await asyncio.gather(
+        *(run_llm(_social_meta_or_fallback, llm, bundle, setting_label) for bundle in bundles)
+    )
+
+
+@router.post("/prompts/bundle", dependencies=[Depends(rate_limit(10, 60))])
+async def generate_prompt_bundle(body: PromptBundleRequest) -> dict:
     """Generate prompt bundles (image + video + social prompts) for manual workflow.
 
     Returns N prompt bundles, each containing:
@@ -61,7 +133,7 @@ async def generate_prompt_bundle(request: Request) -> dict:
     Rate limited to 10 requests per minute per client.
 
     Args:
-        request: FastAPI request object (for rate limiting)
+        body: Validated request body
 
     Returns:
         Dict with:
@@ -82,18 +154,6 @@ async def generate_prompt_bundle(request: Request) -> dict:
         HTTPException: 400 if count invalid or invalid body, 500 if generation fails
         RuntimeError: If LLM API key missing
     """
-    # Parse body manually to work around slowapi/FastAPI integration issue
-    try:
-        body_bytes = await request.body()
-        import json
-        body_dict = json.loads(body_bytes)
-        body = PromptBundleRequest(**body_dict)
-    except Exception as e:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid request body: {str(e)}"
-        )
-
     # Validate count
     if not (1 <= body.count <= 10):
         raise HTTPException(
@@ -110,9 +170,10 @@ async def generate_prompt_bundle(request: Request) -> dict:
         )
 
     try:
-        # Generate bundles via LLM (Grok by default)
+        # Generate bundles via LLM (Grok by default), off the event loop
         llm = prompting_client()
-        bundles = llm.generate_prompt_bundle(
+        bundles = await run_llm(
+            llm.generate_prompt_bundle,
             setting_id=body.setting_id,
             location_label=location["label"],
             location_path=location["path"],
@@ -129,37 +190,20 @@ async def generate_prompt_bundle(request: Request) -> dict:
             single_accessory=body.single_accessory,
         )
 
-        # Store each bundle to prompts.jsonl
-        from app.core.prompt_storage import append_prompt_bundle
-
-        for bundle in bundles:
-            # Add social metadata to bundle
-            # Generate social meta for each bundle
-            try:
-                media_meta = {
-                    "bundle_id": bundle["id"],
-                    "setting": location["label"],
-                    "image_prompt": bundle["image_prompt"]["final_prompt"][:200],
-                    "video_motion": bundle["video_prompt"].get("motion", "")[:100],
-                }
-                social_meta = llm.generate_social_meta(media_meta)
-                bundle["social_meta"] = social_meta
-            except Exception as e:
-                log.warning(f"SOCIAL_META_GENERATION_FAILED bundle_id={bundle['id']}: {e}")
-                # Provide fallback social meta
-                bundle["social_meta"] = {
-                    "title": "Fitness Inspiration",
-                    "caption": "strong, calm and focused 💪",
-                    "tags": ["fitness", "workout", "motivation"],
-                    "hashtags": ["#fitness", "#workout", "#motivation"],
-                }
-
-            append_prompt_bundle(
-                prompts_dir=settings.prompts_out_dir,
-                bundle=bundle,
-                setting=location["label"],
-                seed_words=body.seed_words
-            )
+        # Generate social metadata for all bundles concurrently (one LLM call each)
+        social_metas = await _generate_social_metas(llm, bundles, location["label"])
+
+        for bundle, social_meta in zip(bundles, social_metas):
+            bundle["social_meta"] = social_meta
+
+        # Store all bundles to prompts.jsonl in one write, off the event loop
+        await asyncio.to_thread(
+            append_prompt_bundles,
+            prompts_dir=settings.prompts_out_dir,
+            bundles=bundles,
+            setting=location["label"],
+            seed_words=body.seed_words
+        )
 
         log.info(f"PROMPT_BUNDLE_CREATED count={len(bundles)} setting_id={body.setting_id}")
 
@@ -170,10 +214,62 @@ async def generate_prompt_bundle(request: Request) -> dict:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/prompts")
-@limiter.limit("30/minute")
-def get_recent_prompts(
+def _summary_item(p: dict) -> dict:
+    """Build the list-view summary for an indexed prompt bundle (memoized on the bundle).
+
+    Index bundles are rebuilt whenever prompts or used states change, so the
+    memoized summary (including "used") is dropped with them.
+
+    Args:
+        p: Bundle from load_prompt_index()
+
+    Returns:
+        Summary item dict for GET /prompts
+    """
+    item = p.get("_summary")
+    if item is None:
+        img = p.get("image_prompt", {})
+        img_prompt = img.get("final_prompt", "")
+        item = {
+            "id": p.get("id"),
+            "created_at": p.get("timestamp"),
+            "location": p.get("setting"),
+            "seed_words": p.get("seed_words", []),
+            "used": p.get("used", False),
+            "summary": img_prompt[:100] + "..." if len(img_prompt) > 100 else img_prompt,
+            "media": {
+                "w": img.get("width", 864),
+                "h": img.get("height", 1536),
+                "ar": "9:16",  # Standard aspect ratio
+            },
+            "has_negative": bool(img.get("negative_prompt")),
+        }
+        p["_summary"] = item
+    return item
+
+
+def _if_none_match(request: Request, etag: str) -> bool:
+    """Return True if the request's If-None-Match header matches etag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in (t.strip() for t in header.split(","))
+
+
+# One limiter shared by GET and HEAD /prompts
+_prompts_rate_limit = Depends(rate_limit(30, 60))
+
+
+@router.get("/prompts", response_model=None, dependencies=[_prompts_rate_limit])
+@router.head(
+    "/prompts",
+    response_model=None,
+    dependencies=[_prompts_rate_limit],
+    include_in_schema=False,
+)
+async def get_recent_prompts(
     request: Request,
+    response: Response,
     status: str = "all",  # all, used, unused
     search: str = "",
     page: int = 1,
@@ -181,11 +277,16 @@ def get_recent_prompts(
     sort: str = "-created_at",  # created_at, -created_at, location, -location
     fetch_all: str = "false",  # "true" to return all prompts (no pagination)
     order: str = "created_desc",  # created_desc, created_asc (fallback to sort if not provided)
-) -> dict:
+) -> dict | Response:
     """Get prompt bundles with pagination, search, and filtering.
 
+    Responses carry a weak ETag derived from prompts.jsonl and
+    prompt_states.json; a matching If-None-Match returns 304 without
+    reading or serializing the list. HEAD returns headers only.
+
     Args:
-        request: FastAPI request object (for rate limiting)
+        request: Incoming request (If-None-Match, method)
+        response: Outgoing response (ETag headers)
         status: Filter by used status (all, used, unused)
         search: Search across id, location, seed_words
         page: Page number (1-indexed)
@@ -216,6 +317,17 @@ def get_recent_prompts(
             "total": 253
         }
     """
+    etag = prompts_etag(settings.prompts_out_dir)
+    cache_headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _if_none_match(request, etag):
+        return Response(status_code=304, headers=cache_headers)
+    if request.method == "HEAD":
+        head = Response(headers=cache_headers, media_type="application/json")
+        # The GET body length isn't known without serializing; omit it rather than send 0
+        del head.headers["content-length"]
+        return head
+    response.headers.update(cache_headers)
+
     # Parse fetch_all flag
     all_flag = fetch_all.lower() == "true"
 
@@ -225,56 +337,43 @@ def get_recent_prompts(
         page = max(page, 1)
 
     try:
-        from app.core.prompt_storage import read_all_prompts, load_prompt_states
-
-        # Get all prompts (we'll filter and paginate in memory)
-        all_prompts = read_all_prompts(prompts_dir=settings.prompts_out_dir)
-
-        # Enrich with used state
-        states = load_prompt_states(settings.prompts_out_dir)
-        for prompt in all_prompts:
-            prompt_id = prompt.get("id")
-            if prompt_id and prompt_id in states:
-                prompt["used"] = states[prompt_id].get("used", False)
-            else:
-                prompt["used"] = False
+        # Cached, used-state-enriched prompts pre-sorted by timestamp (read-only;
+        # we filter and paginate in memory into new lists)
+        index = await asyncio.to_thread(load_prompt_index, settings.prompts_out_dir)
+        reverse = sort.startswith("-")
+        sort_field = sort.lstrip("-")
+        if order == "created_asc" or (
+            order != "created_desc" and sort_field == "created_at" and not reverse
+        ):
+            order_key = "oldest_first"
+        else:
+            order_key = "newest_first"
 
-        # Filter by status
-        if status == "used":
-            all_prompts = [p for p in all_prompts if p.get("used")]
-        elif status == "unused":
-            all_prompts = [p for p in all_prompts if not p.get("used")]
+        # Filter by status (pre-split in the index)
+        status_prefix = {"used": "used_", "unused": "unused_"}.get(status, "")
+        all_prompts = index[status_prefix + order_key]
 
-        # Filter by search
+        # Filter by search (id, location, seed_words, image prompt prefix)
         if search:
             search_lower = search.lower()
-            filtered = []
-            for p in all_prompts:
-                if (
-                    search_lower in p.get("id", "").lower()
-                    or search_lower in p.get("setting", "").lower()
-                    or any(search_lower in sw.lower() for sw in p.get("seed_words", []))
-                    or search_lower in p.get("image_prompt", {}).get("final_prompt", "").lower()[:200]
-                ):
-                    filtered.append(p)
-            all_prompts = filtered
-
-        # Sort (prefer order param, fallback to sort for backwards compatibility)
-        if order == "created_asc":
-            all_prompts.sort(key=lambda p: p.get("timestamp", ""), reverse=False)
-        elif order == "created_desc":
-            all_prompts.sort(key=lambda p: p.get("timestamp", ""), reverse=True)
-        else:
-            # Fallback to legacy sort param
-            reverse = sort.startswith("-")
-            sort_field = sort.lstrip("-")
-            if sort_field == "created_at":
-                all_prompts.sort(key=lambda p: p.get("timestamp", ""), reverse=reverse)
-            elif sort_field == "location":
-                all_prompts.sort(key=lambda p: p.get("setting", ""), reverse=reverse)
+            all_prompts = [p for p in all_prompts if search_lower in p["_search_blob"]]
 
-        # Paginate (skip if fetch_all=true)
         total = len(all_prompts)
+
+        # Sort (prefer order param, fallback to sort for backwards compatibility);
+        # created_* orders come pre-sorted from the index. For a page, only the
+        # first page * page_size items are needed, so select them with a heap.
+        if order not in ("created_asc", "created_desc") and sort_field == "location":
+            def setting_key(p: dict) -> str:
+                return str(p.get("setting", ""))
+
+            if all_flag:
+                all_prompts = sorted(all_prompts, key=setting_key, reverse=reverse)
+            else:
+                select = heapq.nlargest if reverse else heapq.nsmallest
+                all_prompts = select(page * page_size, all_prompts, key=setting_key)
+
+        # Paginate (skip if fetch_all=true)
         if all_flag:
             # Return all items without pagination
             page_items = all_prompts
@@ -287,23 +386,7 @@ def get_recent_prompts(
             page_items = all_prompts[start_idx:end_idx]
 
         # Create summary items (remove full prompts to save bandwidth)
-        items = []
-        for p in page_items:
-            img_prompt = p.get("image_prompt", {}).get("final_prompt", "")
-            items.append({
-                "id": p.get("id"),
-                "created_at": p.get("timestamp"),
-                "location": p.get("setting"),
-                "seed_words": p.get("seed_words", []),
-                "used": p.get("used", False),
-                "summary": img_prompt[:100] + "..." if len(img_prompt) > 100 else img_prompt,
-                "media": {
-                    "w": p.get("image_prompt", {}).get("width", 864),
-                    "h": p.get("image_prompt", {}).get("height", 1536),
-                    "ar": "9:16",  # Standard aspect ratio
-                },
-                "has_negative": bool(p.get("image_prompt", {}).get("negative_prompt")),
-            })
+        items = [_summary_item(p) for p in page_items]
 
         return {
             "ok": True,
@@ -318,13 +401,11 @@ def get_recent_prompts(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/prompts/{bundle_id}")
-@limiter.limit("60/minute")
-def get_prompt_bundle(request: Request, bundle_id: str) -> dict:
+@router.get("/prompts/{bundle_id}", dependencies=[Depends(rate_limit(60, 60))])
+async def get_prompt_bundle(bundle_id: str) -> dict:
     """Get full prompt bundle details by ID.
 
     Args:
-        request: FastAPI request object (for rate limiting)
         bundle_id: Prompt bundle ID (pr_...)
 
     Returns:
@@ -358,10 +439,8 @@ def get_prompt_bundle(request: Request, bundle_id: str) -> dict:
         HTTPException: 404 if bundle not found, 500 on error
     """
     try:
-        from app.core.prompt_storage import find_prompt_bundle, get_prompt_state
-
-        # Find bundle
-        bundle = find_prompt_bundle(settings.prompts_out_dir, bundle_id)
+        # Find bundle (storage reads run off the event loop)
+        bundle = await asyncio.to_thread(find_prompt_bundle, settings.prompts_out_dir, bundle_id)
         if not bundle:
             raise HTTPException(
                 status_code=404,
@@ -369,7 +448,7 @@ def get_prompt_bundle(request: Request, bundle_id: str) -> dict:
             )
 
         # Get used state
-        state = get_prompt_state(settings.prompts_out_dir, bundle_id)
+        state = await asyncio.to_thread(get_prompt_state, settings.prompts_out_dir, bundle_id)
         used = state.get("used", False) if state else False
 
         # Format response
@@ -426,58 +505,47 @@ class PromptStateUpdate(BaseModel):
     used: bool
 
 
-@router.patch("/prompts/{bundle_id}/state")
-@limiter.limit("60/minute")
-async def update_prompt_state(request: Request, bundle_id: str) -> dict:
+@router.patch("/prompts/{bundle_id}/state", dependencies=[Depends(rate_limit(60, 60))])
+async def update_prompt_state(bundle_id: str, body: PromptStateUpdate) -> dict:
     """Update used state for a prompt bundle.
 
     Args:
-        request: FastAPI request object (for rate limiting)
         bundle_id: Prompt bundle ID (pr_...)
+        body: Validated request body
 
     Returns:
         Dict with:
         {
             "ok": True,
             "bundle_id": "pr_abc123...",
-            "used": true
+            "used": true,
+            "changed": true  # false if the bundle already had this state
         }
 
     Raises:
         HTTPException: 400 if invalid body, 404 if bundle not found, 500 on error
     """
-    # Parse body
     try:
-        body_bytes = await request.body()
-        import json
-        body_dict = json.loads(body_bytes)
-        body = PromptStateUpdate(**body_dict)
-    except Exception as e:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid request body: {str(e)}"
-        )
-
-    try:
-        from app.core.prompt_storage import find_prompt_bundle, update_prompt_state as save_state
-
-        # Verify bundle exists
-        bundle = find_prompt_bundle(settings.prompts_out_dir, bundle_id)
+        # Verify bundle exists (storage I/O runs off the event loop)
+        bundle = await asyncio.to_thread(find_prompt_bundle, settings.prompts_out_dir, bundle_id)
         if not bundle:
             raise HTTPException(
                 status_code=404,
                 detail=f"Prompt bundle not found: {bundle_id}"
             )
 
-        # Update state
-        save_state(settings.prompts_out_dir, bundle_id, body.used)
+        # Update state (no write if unchanged, so repeat clicks are cheap)
+        changed = await asyncio.to_thread(
+            save_prompt_state, settings.prompts_out_dir, bundle_id, body.used
+        )
 
-        log.info(f"PROMPT_STATE_UPDATED bundle_id={bundle_id} used={body.used}")
+        log.info(f"PROMPT_STATE_UPDATED bundle_id={bundle_id} used={body.used} changed={changed}")
 
         return {
             "ok": True,
             "bundle_id": bundle_id,
-            "used": body.used
+            "used": body.used,
+            "changed": changed,
         }
 
     except HTTPException:
@@ -487,21 +555,91 @@ async def update_prompt_state(request: Request, bundle_id: str) -> dict:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Max bundles per bulk state update (one full rolling window)
+MAX_BULK_STATES = MAX_PROMPTS
+
+
+class PromptStateBulkUpdate(BaseModel):
+    """Request body for updating many prompt states at once."""
+
+    states: dict[str, bool]  # bundle_id -> used
+
+
+@router.patch("/prompts/state", dependencies=[Depends(rate_limit(10, 60))])
+async def update_prompt_states(body: PromptStateBulkUpdate) -> dict:
+    """Update used state for many prompt bundles in one write.
+
+    Accepts up to MAX_BULK_STATES bundles per request; the states file is
+    rewritten at most once. Rate limited to 10 requests per minute per client.
+
+    Args:
+        body: Validated request body
+
+    Returns:
+        Dict with:
+        {
+            "ok": True,
+            "states": {"pr_abc123...": true, ...},
+            "changed": ["pr_abc123..."]  # IDs whose state actually changed
+        }
+
+    Raises:
+        HTTPException: 400 if invalid body or too many states,
+            404 if any bundle not found, 500 on error
+    """
+    if not (1 <= len(body.states) <= MAX_BULK_STATES):
+        raise HTTPException(
+            status_code=400,
+            detail=f"states must contain between 1 and {MAX_BULK_STATES} bundles"
+        )
+
+    try:
+        # Verify every bundle exists before writing anything (all-or-nothing)
+        def missing_ids() -> list[str]:
+            return [
+                bundle_id for bundle_id in body.states
+                if not find_prompt_bundle(settings.prompts_out_dir, bundle_id)
+            ]
+
+        missing = await asyncio.to_thread(missing_ids)
+        if missing:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Prompt bundles not found: {', '.join(missing)}"
+            )
+
+        changed = await asyncio.to_thread(save_prompt_states, settings.prompts_out_dir, body.states)
+
+        log.info(f"PROMPT_STATES_UPDATED count={len(body.states)} changed={len(changed)}")
+
+        return {"ok": True, "states": body.states, "changed": changed}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        log.error(f"PROMPT_STATES_UPDATE_FAILED: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ============================================================================
 # Locations Endpoint (Location Discovery)
 # ============================================================================
 
 
-@router.get("/locations")
-@limiter.limit("60/minute")
-def get_locations(request: Request, refresh: int = 0) -> dict:
+# Pre-serialized /locations body: (location list it was built from, JSON bytes).
+# LocationCache swaps in a new list on every rescan, so identity marks staleness.
+_locations_payload: tuple[list, bytes] | None = None
+
+
+@router.get("/locations", dependencies=[Depends(rate_limit(60, 60))])
+def get_locations(refresh: int = 0) -> Response:
     """Get all available locations for prompt generation.
 
     Scans app/data/locations/ for scene bank JSON files and returns metadata.
-    Results are cached in memory; use ?refresh=1 to force rescan.
+    Results and the serialized response body are cached in memory; use
+    ?refresh=1 to force rescan.
 
     Args:
-        request: FastAPI request object (for rate limiting)
         refresh: Set to 1 to force filesystem rescan
 
     Returns:
@@ -523,9 +661,15 @@ def get_locations(request: Request, refresh: int = 0) -> dict:
     Raises:
         HTTPException: 500 if scan fails
     """
+    global _locations_payload
+
     try:
         locations = get_all_locations(refresh=bool(refresh))
-        return {"ok": True, "locations": locations}
+        cached = _locations_payload
+        if cached is None or cached[0] is not locations:
+            cached = (locations, orjson.dumps({"ok": True, "locations": locations}))
+            _locations_payload = cached
+        return Response(content=cached[1], media_type="application/json")
     except Exception as e:
         log.error(f"LOCATIONS_SCAN_FAILED: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -536,19 +680,13 @@ def get_locations(request: Request, refresh: int = 0) -> dict:
 # ============================================================================
 
 
-@router.get("/healthz")
-def healthz() -> dict:
-    """Health check endpoint with Prompt Lab readiness status.
+# Cached /healthz body: (monotonic time built, payload)
+HEALTHZ_TTL_S = 2.0
+_healthz_cache: tuple[float, dict] | None = None
 
-    Returns:
-        Dict with status and configuration (NO SECRETS)
-    """
-    # Check LLM provider availability
-    llm_status = "key_missing"
-    if settings.llm_provider == "grok":
-        llm_status = "configured" if settings.grok_api_key else "key_missing"
-    # Future: add gemini, gpt checks here
 
+def _build_healthz() -> dict:
+    """Build the /healthz body from settings and config file presence."""
     # Check persona and variety bank files
     persona_path = Path(settings.persona_file)
     variety_path = Path(settings.variety_file)
@@ -556,11 +694,7 @@ def healthz() -> dict:
     return {
         "ok": True,
         "mode": "prompt_lab",
-        "llm": {
-            "provider": settings.llm_provider,
-            "model": settings.grok_model if settings.llm_provider == "grok" else "unknown",
-            "status": llm_status,
-        },
+        "llm": settings.llm_status,
         "config_files": {
             "persona": "present" if persona_path.exists() else "missing",
             "variety_bank": "present" if variety_path.exists() else "missing",
@@ -569,21 +703,36 @@ def healthz() -> dict:
     }
 
 
-@router.get("/logs/tail")
-@limiter.limit("60/minute")
-def get_logs_tail(request: Request, lines: int = 100) -> dict:
+@router.get("/healthz")
+async def healthz() -> dict:
+    """Health check endpoint with Prompt Lab readiness status.
+
+    The body is cached for HEALTHZ_TTL_S seconds so frequent probes skip
+    the config file checks.
+
+    Returns:
+        Dict with status and configuration (NO SECRETS)
+    """
+    global _healthz_cache
+
+    now = time.monotonic()
+    cached = _healthz_cache
+    if cached is None or now - cached[0] >= HEALTHZ_TTL_S:
+        cached = (now, _build_healthz())
+        _healthz_cache = cached
+    return cached[1]
+
+
+@router.get("/logs/tail", dependencies=[Depends(rate_limit(60, 60))])
+def get_logs_tail(lines: int = 100) -> dict:
     """Get last N lines from logs.txt for real-time log viewing.
 
     Args:
-        request: FastAPI request object (for rate limiting)
         lines: Number of lines to return (default 100, max 10000)
 
     Returns:
         Dict with log lines array and metadata
     """
-    # Truncate log file if needed (keeps last 10k lines)
-    truncate_log_file()
-
     max_lines = min(lines, 10000)  # Cap at 10000 lines
     log_file = str(get_data_path("logs.txt"))
 
@@ -591,15 +740,20 @@ def get_logs_tail(request: Request, lines: int = 100) -> dict:
         return {"ok": True, "logs": [], "message": "No logs yet"}
 
     try:
-        with open(log_file, "r", encoding="utf-8", errors="replace") as f:
-            all_lines = f.readlines()
-            tail_lines = all_lines[-max_lines:] if len(all_lines) > max_lines else all_lines
+        # Truncate log file only once it has grown past the threshold
+        # (keeps last 10k lines); counting reads only newly appended bytes
+        total_lines = count_lines(log_file)
+        if total_lines > TRUNCATE_THRESHOLD:
+            truncate_log_file()
+            total_lines = count_lines(log_file)
+
+        logs = tail_lines(log_file, max_lines)
 
         return {
             "ok": True,
-            "logs": [line.rstrip('\n') for line in tail_lines],
-            "total_lines": len(all_lines),
-            "returned_lines": len(tail_lines)
+            "logs": logs,
+            "total_lines": total_lines,
+            "returned_lines": len(logs)
         }
     except Exception as e:
         log.error(f"Failed to read logs: {e}")
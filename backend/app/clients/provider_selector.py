@@ -6,6 +6,8 @@ Prompt Lab mode: only prompting_client() is available.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from app.clients.llm_interface import LLMClient, GrokAdapter
 from app.grok import GrokClient
 from app.core.config import settings
@@ -28,12 +30,17 @@ def _guard_llm(provider: str, key: str | None) -> None:
         )
 
 
+@lru_cache(maxsize=1)
 def prompting_client() -> LLMClient:
     """Returns configured LLM client for prompt generation.
 
     Provider selection based on LLM_PROVIDER env var (default: grok).
     Returns LLMClient interface for provider-agnostic access.
 
+    The client is built once per process and shared, so its HTTP connection
+    pool stays warm across requests. Errors are not cached; a missing key
+    is re-checked on the next call.
+
     Supported providers:
     - grok: xAI Grok (default)
     - gemini: Google Gemini Pro (future)
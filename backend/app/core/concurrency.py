@@ -1,41 +1,124 @@
-"""Concurrency control for Prompt Lab (minimal no-op stub).
+"""Concurrency control for Prompt Lab LLM calls.
 
-In Prompt Lab mode, we only use Grok for prompt generation,
-and throttling is not needed. This stub maintains import
-compatibility without any actual rate limiting.
+Async routes run LLM calls through run_llm(), which waits on a process-wide
+asyncio semaphore sized by LLM_MAX_CONCURRENCY *before* dispatching the
+blocking call to a dedicated LLM thread pool. Queued requests therefore
+wait as coroutines rather than as parked threads, and storage I/O on the
+default executor (asyncio.to_thread) never queues behind LLM calls.
+
+grok_slot() remains the thread-level guard inside GrokClient._call_api,
+covering synchronous callers outside the event loop.
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Callable, Generator, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+_GROK_MAX = settings.llm_max_concurrency
+_grok_sem = threading.BoundedSemaphore(_GROK_MAX)
+_grok_in_use = 0
+_grok_lock = threading.Lock()
+
+# Event-loop-level limiter and the pool LLM calls run on; one thread per
+# slot, so the pool never queues. Created per app lifespan by startup() (or
+# lazily by run_llm), since a semaphore binds to one event loop and a shut
+# down pool cannot be reused.
+_llm_sem: asyncio.Semaphore | None = None
+_llm_executor: ThreadPoolExecutor | None = None
+
+
+def startup() -> tuple[asyncio.Semaphore, ThreadPoolExecutor]:
+    """Create the LLM limiter and thread pool (call on app startup).
+
+    Returns:
+        The new (semaphore, executor) pair
+    """
+    global _llm_sem, _llm_executor
+
+    _llm_sem = asyncio.Semaphore(_GROK_MAX)
+    _llm_executor = ThreadPoolExecutor(max_workers=_GROK_MAX, thread_name_prefix="llm")
+    return _llm_sem, _llm_executor
+
+
+async def run_llm(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking LLM call once a process-wide LLM slot is free.
+
+    Usage:
+        bundles = await run_llm(llm.generate_prompt_bundle, setting_id=..., count=3)
+
+    Args:
+        func: Synchronous LLM client method
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Whatever func returns
+    """
+    if _llm_sem is None or _llm_executor is None:
+        sem, executor = startup()
+    else:
+        sem, executor = _llm_sem, _llm_executor
+
+    async with sem:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+
+def shutdown() -> None:
+    """Shut down the LLM thread pool (call on app shutdown).
+
+    The next startup() or run_llm() call creates a fresh limiter and pool.
+    """
+    global _llm_sem, _llm_executor
+
+    if _llm_executor is not None:
+        _llm_executor.shutdown(wait=False, cancel_futures=True)
+    _llm_sem = None
+    _llm_executor = None
 
 
 @contextmanager
 def grok_slot() -> Generator[None, None, None]:
-    """No-op context manager for Grok API calls.
+    """Hold one of the process-wide Grok call slots for the duration of a call.
 
-    Prompt Lab doesn't need throttling; kept for import compatibility.
+    Blocks until a slot is free when LLM_MAX_CONCURRENCY calls are already
+    in flight.
 
     Usage:
         with grok_slot():
             # Make Grok API call
             response = grok_client.generate(...)
     """
-    yield
+    global _grok_in_use
 
+    with _grok_sem:
+        with _grok_lock:
+            _grok_in_use += 1
+        try:
+            yield
+        finally:
+            with _grok_lock:
+                _grok_in_use -= 1
 
-def status() -> dict[str, dict[str, int | None]]:
-    """Return concurrency status (no-op stub).
 
-    Kept for compatibility; not used in Prompt Lab.
+def status() -> dict[str, dict[str, int | None]]:
+    """Return concurrency status for LLM call slots.
 
     Returns:
-        Minimal status dict indicating no active throttling
+        Dict with in-use and max slot counts per provider
     """
     return {
         "grok": {
-            "in_use": 0,
-            "max": None,  # No limit
+            "in_use": _grok_in_use,
+            "max": _GROK_MAX,
         }
     }
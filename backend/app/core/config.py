@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -30,6 +31,9 @@ class Settings(BaseSettings):
     # Cost tracking (Prompt Lab manual workflow)
     max_cost_per_run: float = Field(default=10.0, env="MAX_COST_PER_RUN")
 
+    # Max concurrent LLM API calls across all requests (process-wide)
+    llm_max_concurrency: int = Field(default=4, ge=1, env="LLM_MAX_CONCURRENCY")
+
     # Future LLM Providers (stubs for later implementation)
     # gemini_api_key: str | None = Field(default=None, env="GEMINI_API_KEY")
     # gemini_model: str = Field(default="gemini-pro", env="GEMINI_MODEL")
@@ -41,6 +45,21 @@ class Settings(BaseSettings):
     variety_file: str = Field(default=str(PROJECT_ROOT / "app" / "data" / "variety_bank.json"), env="VARIETY_FILE")
     prompts_out_dir: str = Field(default=str(PROJECT_ROOT / "app" / "data" / "prompts"), env="PROMPTS_OUT_DIR")
 
+    @cached_property
+    def llm_status(self) -> dict[str, str]:
+        """LLM provider readiness for /healthz (NO SECRETS).
+
+        Computed once; provider settings only change on restart.
+        """
+        if self.llm_provider == "grok":
+            return {
+                "provider": self.llm_provider,
+                "model": self.grok_model,
+                "status": "configured" if self.grok_api_key else "key_missing",
+            }
+        # Future: add gemini, gpt checks here
+        return {"provider": self.llm_provider, "model": "unknown", "status": "key_missing"}
+
     class Config:
         env_file = "../.env"  # Look in parent directory (project root)
         extra = "ignore"
@@ -0,0 +1,52 @@
+"""Parsed JSON config cache with mtime invalidation.
+
+persona.json, variety_bank.json and the location scene banks are read on
+every prompt generation. This keeps the parsed object in memory and only
+re-parses a file when its mtime or size changes on disk.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+_LOCK = threading.Lock()
+_CACHE: dict[str, tuple[tuple[int, int], Any]] = {}
+
+
+def load_json_cached(path: str | Path) -> Any:
+    """Load a JSON file, reusing the parsed object while the file is unchanged.
+
+    Args:
+        path: Path to JSON file
+
+    Returns:
+        Parsed JSON object
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        orjson.JSONDecodeError: If the file is not valid JSON (a
+            json.JSONDecodeError subclass)
+
+    Note:
+        The returned object is shared between callers; treat it as read-only.
+    """
+    key = str(path)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    with _LOCK:
+        cached = _CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+    with open(key, "rb") as f:
+        data = orjson.loads(f.read())
+
+    with _LOCK:
+        _CACHE[key] = (stamp, data)
+    return data
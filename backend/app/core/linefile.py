@@ -0,0 +1,83 @@
+"""Block-wise readers for line-oriented files (prompts.jsonl, logs.txt).
+
+Shared by prompt storage and log tailing so neither reads a whole file
+just to reach its last lines or to count them.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import BinaryIO, Iterator
+
+# Block size for reverse tail reads and incremental counting
+BLOCK_SIZE = 65536
+
+# Incremental line counts per path: path -> (inode, bytes_counted, lines)
+_line_counts: dict[str, tuple[int, int, int]] = {}
+_line_counts_lock = threading.Lock()
+
+
+def iter_lines_reversed(f: BinaryIO) -> Iterator[bytes]:
+    """Yield the lines of a binary file from last to first.
+
+    Reads BLOCK_SIZE blocks backwards from EOF, so stopping early only
+    costs the blocks actually consumed. A trailing newline terminates the
+    last line rather than starting an empty one.
+
+    Args:
+        f: File opened in binary mode (seekable)
+
+    Yields:
+        Lines without their "\\n" terminator, newest first
+    """
+    end = f.seek(0, os.SEEK_END)
+    if end:
+        f.seek(end - 1)
+        if f.read(1) == b"\n":
+            end -= 1
+
+    pos = end
+    partial = b""  # Leading fragment of the blocks read so far
+    while pos > 0:
+        step = min(BLOCK_SIZE, pos)
+        pos -= step
+        f.seek(pos)
+        lines = (f.read(step) + partial).split(b"\n")
+        # The first line may continue in the previous block
+        partial = lines.pop(0)
+        yield from reversed(lines)
+
+    if end:
+        yield partial
+
+
+def count_lines(path: str) -> int:
+    """Count lines in an append-only file, reading only bytes added since last call.
+
+    The count is cached per path with the inode and the number of bytes
+    already counted. If the file was replaced (new inode, e.g. temp +
+    rename compaction) or shrank (truncated), it is recounted from scratch.
+
+    Args:
+        path: Path to text file
+
+    Returns:
+        Number of newline-terminated lines
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    with _line_counts_lock:
+        with open(path, "rb") as f:
+            inode = os.fstat(f.fileno()).st_ino
+            cached_inode, counted, lines = _line_counts.get(path, (inode, 0, 0))
+            size = f.seek(0, os.SEEK_END)
+            if cached_inode != inode or size < counted:
+                counted, lines = 0, 0
+            f.seek(counted)
+            while chunk := f.read(BLOCK_SIZE):
+                lines += chunk.count(b"\n")
+                counted += len(chunk)
+        _line_counts[path] = (inode, counted, lines)
+        return lines
@@ -5,10 +5,11 @@ Scans app/data/locations/ for scene banks and provides location metadata.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import TypedDict
 
+import orjson
+
 from app.core.logging import log
 from app.core.paths import get_data_path
 
@@ -30,6 +31,9 @@ class LocationCache:
         self._locations: list[LocationRecord] = []
         self._id_map: dict[str, LocationRecord] = {}
         self._loaded = False
+        # Scene count per file path, keyed by (mtime_ns, size) so rescans
+        # only re-parse files that changed
+        self._scene_counts: dict[str, tuple[tuple[int, int], int]] = {}
 
     def get_all(self, refresh: bool = False) -> list[LocationRecord]:
         """Get all locations, loading from disk if needed.
@@ -79,13 +83,7 @@ class LocationCache:
                 # Use as_posix() to get consistent forward slashes, then replace with hyphens
                 location_id = relative.with_suffix("").as_posix().replace("/", "-")
 
-                # Load file to get scene count
-                try:
-                    with open(json_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        scene_count = len(data.get("scenes", []))
-                except Exception:
-                    scene_count = 0
+                scene_count = self._scene_count(json_file)
 
                 # Build label and group
                 label, group = self._build_labels(relative)
@@ -111,8 +109,40 @@ class LocationCache:
         self._id_map = {r["id"]: r for r in records}
         self._loaded = True
 
+        # Drop counts for files that no longer exist
+        live = {r["path"] for r in records}
+        self._scene_counts = {p: v for p, v in self._scene_counts.items() if p in live}
+
         log.info(f"LOCATIONS_SCANNED count={len(records)}")
 
+    def _scene_count(self, json_file: Path) -> int:
+        """Get number of scenes in a location file, re-parsing only if it changed.
+
+        Args:
+            json_file: Path to location JSON file
+
+        Returns:
+            Scene count (0 if the file cannot be parsed)
+        """
+        key = str(json_file)
+        st = json_file.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        cached = self._scene_counts.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        # Load file to get scene count
+        try:
+            with open(json_file, "rb") as f:
+                data = orjson.loads(f.read())
+                scene_count = len(data.get("scenes", []))
+        except Exception:
+            scene_count = 0
+
+        self._scene_counts[key] = (stamp, scene_count)
+        return scene_count
+
     def _build_labels(self, relative_path: Path) -> tuple[str, str]:
         """Build human-readable label and group from file path.
 
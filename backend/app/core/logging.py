@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import logging
-import os
+import mmap
+from itertools import islice
+from typing import BinaryIO
 
+from app.core.linefile import iter_lines_reversed
 from app.core.paths import get_data_path
 
 # Ensure logs directory exists
@@ -45,6 +48,50 @@ def truncate_log_file() -> None:
         print(f"LOG_ROTATION_ERROR: Failed to truncate log file: {e}")
 
 
+def _tail_lines_blocks(f: BinaryIO, n: int) -> list[bytes]:
+    """Fallback tail reader: read blocks backwards from EOF (oldest line first)."""
+    return list(islice(iter_lines_reversed(f), n))[::-1]
+
+
+def tail_lines(path: str, n: int) -> list[str]:
+    """Return the last n lines of a file without reading the whole file.
+
+    Memory-maps the file and walks backwards with rfind until n newlines
+    are found, then decodes only that tail. Falls back to backwards block
+    reads when the file is empty or cannot be mapped.
+
+    Args:
+        path: Path to text file
+        n: Number of lines to return
+
+    Returns:
+        Up to n lines (without line terminators), oldest first
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    if n <= 0:
+        return []
+
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            raw = _tail_lines_blocks(f, n)
+        else:
+            with mm:
+                end = len(mm)
+                # A trailing newline terminates the last line, it doesn't start a new one
+                pos = end - 1 if mm[end - 1:end] == b"\n" else end
+                for _ in range(n):
+                    pos = mm.rfind(b"\n", 0, pos)
+                    if pos == -1:
+                        break
+                raw = mm[pos + 1:end].splitlines()
+
+    return [line.decode("utf-8", errors="replace") for line in raw[-n:]]
+
+
 # Truncate logs on startup if needed
 truncate_log_file()
 
@@ -2,24 +2,44 @@
 Prompt bundle storage with rolling window (keep last 100).
 
 Uses JSONL format (one JSON object per line) for efficient appending.
+New bundles are appended to the end of the file; the file is only rewritten
+(compacted to the last MAX_PROMPTS entries) once it holds more than
+COMPACT_AT lines. Readers always see the last MAX_PROMPTS entries.
 """
 
 from __future__ import annotations
 
-import json
 import os
 import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+from app.core.linefile import count_lines, iter_lines_reversed
+from app.core.logging import log
+
 LOCK = threading.Lock()
 MAX_PROMPTS = 100  # Rolling window size
+COMPACT_AT = MAX_PROMPTS * 2  # Rewrite the file once it holds this many lines
+
+# Directories already created by this process (skip repeated mkdir syscalls)
+_dirs_created: set[str] = set()
+
+# Cached id -> bundle map for find_prompt_bundle: ((path, prompts stamp), map)
+_bundles_by_id: tuple[tuple[Any, ...], dict[str, dict[str, Any]]] | None = None
+
+# Cached prompt index: ((prompts_dir, prompts stamp, states stamp), index)
+_prompt_index: tuple[tuple[Any, ...], dict[str, list[dict[str, Any]]]] | None = None
 
 
 def ensure_prompts_dir(prompts_dir: str) -> None:
-    """Ensure prompts output directory exists."""
+    """Ensure prompts output directory exists (mkdir once per process)."""
+    if prompts_dir in _dirs_created:
+        return
     Path(prompts_dir).mkdir(parents=True, exist_ok=True)
+    _dirs_created.add(prompts_dir)
 
 
 def get_prompts_file(prompts_dir: str) -> str:
@@ -28,30 +48,56 @@ def get_prompts_file(prompts_dir: str) -> str:
     return os.path.join(prompts_dir, "prompts.jsonl")
 
 
-def _load_jsonl(path: str) -> list[dict[str, Any]]:
-    """Load all entries from JSONL file."""
-    if not os.path.exists(path):
+def _load_tail(path: str, n: int) -> list[dict[str, Any]]:
+    """Load the last n entries from JSONL file without reading the whole file.
+
+    Walks lines backwards from EOF (block reads) until n entries are
+    parsed or the start of the file is reached. Blank and malformed lines
+    are skipped.
+
+    Args:
+        path: Path to JSONL file
+        n: Max number of entries to return
+
+    Returns:
+        Up to n entries in file order (oldest first)
+    """
+    if n <= 0:
+        return []
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
         return []
 
-    entries = []
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
+    newest_first: list[dict[str, Any]] = []
+    with f:
+        for line in iter_lines_reversed(f):
             line = line.strip()
-            if line:
-                try:
-                    entries.append(json.loads(line))
-                except json.JSONDecodeError:
-                    # Skip malformed lines
-                    continue
-    return entries
+            if not line:
+                continue
+            try:
+                newest_first.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                # Skip malformed lines
+                continue
+            if len(newest_first) == n:
+                break
+
+    newest_first.reverse()
+    return newest_first
+
+
+def _load_window(path: str) -> list[dict[str, Any]]:
+    """Load the rolling window (last MAX_PROMPTS entries) from JSONL file."""
+    return _load_tail(path, MAX_PROMPTS)
 
 
 def _dump_jsonl(path: str, entries: list[dict[str, Any]]) -> None:
     """Atomically write entries to JSONL file using temp + rename."""
     tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
+    with open(tmp, "wb") as f:
         for entry in entries:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.write(orjson.dumps(entry) + b"\n")
     os.replace(tmp, path)
 
 
@@ -69,39 +115,65 @@ def append_prompt_bundle(
         bundle: Prompt bundle dict (id, image_prompt, video_prompt)
         setting: High-level setting used
         seed_words: Optional seed words used
+    """
+    append_prompt_bundles(prompts_dir, [bundle], setting, seed_words)
+
+
+def append_prompt_bundles(
+    prompts_dir: str,
+    bundles: list[dict[str, Any]],
+    setting: str,
+    seed_words: list[str] | None = None,
+) -> None:
+    """
+    Append a batch of prompt bundles to prompts.jsonl in a single write.
+
+    Args:
+        prompts_dir: Directory for prompts output
+        bundles: Prompt bundle dicts (id, image_prompt, video_prompt), in order
+        setting: High-level setting used
+        seed_words: Optional seed words used
 
     Note:
-        Keeps only last MAX_PROMPTS entries (rolling window).
+        Appends one line per bundle; the file is compacted to the last
+        MAX_PROMPTS entries once it exceeds COMPACT_AT lines (rolling window).
     """
-    import logging
-    log = logging.getLogger("ai-influencer")
+    if not bundles:
+        return
 
     path = get_prompts_file(prompts_dir)
-    log.info(f"DEBUG_APPEND bundle_id={bundle['id']} path={path}")
-
-    # Create enriched entry with timestamp and metadata
-    entry = {
-        "id": bundle["id"],
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "setting": setting,
-        "seed_words": seed_words or [],
-        "image_prompt": bundle["image_prompt"],
-        "video_prompt": bundle["video_prompt"],
-        "social_meta": bundle.get("social_meta", {}),
-    }
+    log.info(f"DEBUG_APPEND count={len(bundles)} path={path}")
+
+    # Create enriched entries with timestamp and metadata
+    payload = b"".join(
+        orjson.dumps({
+            "id": bundle["id"],
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "setting": setting,
+            "seed_words": seed_words or [],
+            "image_prompt": bundle["image_prompt"],
+            "video_prompt": bundle["video_prompt"],
+            "social_meta": bundle.get("social_meta", {}),
+        }) + b"\n"
+        for bundle in bundles
+    )
+
+    global _prompt_index, _bundles_by_id
 
     with LOCK:
-        entries = _load_jsonl(path)
-        log.info(f"DEBUG_LOADED_ENTRIES count={len(entries)}")
-        entries.append(entry)
-        log.info(f"DEBUG_APPENDED_ENTRY count={len(entries)} new_id={bundle['id']}")
-
-        # Enforce rolling window: keep last MAX_PROMPTS only
-        if len(entries) > MAX_PROMPTS:
-            entries = entries[-MAX_PROMPTS:]
+        _prompt_index = None
+        _bundles_by_id = None
+        with open(path, "ab") as f:
+            f.write(payload)
+        # Incremental: only the bytes just appended are read
+        count = count_lines(path)
+        log.info(f"DEBUG_APPENDED_ENTRIES count={count} new_ids={[b['id'] for b in bundles]}")
 
-        _dump_jsonl(path, entries)
-        log.info(f"DEBUG_WRITTEN path={path} count={len(entries)}")
+        # Enforce rolling window: compact to last MAX_PROMPTS only when needed
+        if count > COMPACT_AT:
+            entries = _load_window(path)
+            _dump_jsonl(path, entries)
+            log.info(f"DEBUG_COMPACTED path={path} count={len(entries)}")
 
 
 def read_recent_prompts(prompts_dir: str, limit: int = 20) -> list[dict[str, Any]]:
@@ -118,9 +190,9 @@ def read_recent_prompts(prompts_dir: str, limit: int = 20) -> list[dict[str, Any
     path = get_prompts_file(prompts_dir)
 
     with LOCK:
-        entries = _load_jsonl(path)
-        # Reverse to get newest first
-        return list(reversed(entries[-limit:]))
+        # Tail-read only the entries needed, then reverse to get newest first
+        entries = _load_tail(path, min(limit, MAX_PROMPTS))
+        return list(reversed(entries))
 
 
 def read_all_prompts(prompts_dir: str) -> list[dict[str, Any]]:
@@ -136,7 +208,7 @@ def read_all_prompts(prompts_dir: str) -> list[dict[str, Any]]:
     path = get_prompts_file(prompts_dir)
 
     with LOCK:
-        entries = _load_jsonl(path)
+        entries = _load_window(path)
         # Reverse to get newest first
         return list(reversed(entries))
 
@@ -151,15 +223,29 @@ def find_prompt_bundle(prompts_dir: str, bundle_id: str) -> dict[str, Any] | Non
 
     Returns:
         Prompt bundle dict if found, None otherwise
+
+    Note:
+        Lookups use an id -> bundle map rebuilt only when prompts.jsonl
+        changes; the returned dict is shared, treat it as read-only.
     """
+    global _bundles_by_id
+
     path = get_prompts_file(prompts_dir)
 
     with LOCK:
-        entries = _load_jsonl(path)
-        for entry in entries:
-            if entry.get("id") == bundle_id:
-                return entry
-        return None
+        key = (path, _file_stamp(path))
+        cached = _bundles_by_id
+        if cached is None or cached[0] != key:
+            by_id: dict[str, dict[str, Any]] = {}
+            for entry in _load_window(path):
+                entry_id = entry.get("id")
+                # Entries without an id can never match; first (oldest) entry
+                # wins, as with the previous linear scan
+                if entry_id is not None:
+                    by_id.setdefault(entry_id, entry)
+            cached = (key, by_id)
+            _bundles_by_id = cached
+        return cached[1].get(bundle_id)
 
 
 # ============================================================================
@@ -183,13 +269,12 @@ def load_prompt_states(prompts_dir: str) -> dict[str, dict[str, Any]]:
     """
     states_file = get_states_file(prompts_dir)
 
-    if not os.path.exists(states_file):
-        return {}
-
     try:
-        with open(states_file, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError:
+        with open(states_file, "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return {}
+    except orjson.JSONDecodeError:
         # Corrupted file - return empty dict
         return {}
 
@@ -201,35 +286,70 @@ def save_prompt_states(prompts_dir: str, states: dict[str, dict[str, Any]]) -> N
         prompts_dir: Directory for prompts output
         states: States dict to save
     """
+    global _prompt_index
+
+    _prompt_index = None
     states_file = get_states_file(prompts_dir)
     tmp_file = states_file + ".tmp"
 
-    with open(tmp_file, "w", encoding="utf-8") as f:
-        json.dump(states, f, indent=2, ensure_ascii=False)
+    with open(tmp_file, "wb") as f:
+        f.write(orjson.dumps(states))
 
     os.replace(tmp_file, states_file)
 
 
-def update_prompt_state(prompts_dir: str, bundle_id: str, used: bool) -> None:
+def update_prompt_state(prompts_dir: str, bundle_id: str, used: bool) -> bool:
     """Update used state for a prompt bundle.
 
+    The states file is only rewritten if the used flag actually changes
+    (bundles without a stored state count as unused).
+
     Args:
         prompts_dir: Directory for prompts output
         bundle_id: Prompt bundle ID (pr_...)
         used: Whether prompt has been used
 
+    Returns:
+        True if the state was written, False if it was already `used`
+
+    Note:
+        Thread-safe with file locking
+    """
+    return bool(update_prompt_states(prompts_dir, {bundle_id: used}))
+
+
+def update_prompt_states(prompts_dir: str, updates: dict[str, bool]) -> list[str]:
+    """Update used state for many prompt bundles with a single write.
+
+    Bundles whose used flag already matches are skipped (bundles without a
+    stored state count as unused); the states file is only rewritten if at
+    least one flag changes.
+
+    Args:
+        prompts_dir: Directory for prompts output
+        updates: Mapping of bundle_id -> used
+
+    Returns:
+        IDs whose state changed, in the order given
+
     Note:
         Thread-safe with file locking
     """
     with LOCK:
         states = load_prompt_states(prompts_dir)
+        updated_at = datetime.utcnow().isoformat() + "Z"
 
-        states[bundle_id] = {
-            "used": used,
-            "updated_at": datetime.utcnow().isoformat() + "Z",
-        }
+        changed = []
+        for bundle_id, used in updates.items():
+            current = states.get(bundle_id)
+            if (current.get("used", False) if current else False) == used:
+                continue
+            states[bundle_id] = {"used": used, "updated_at": updated_at}
+            changed.append(bundle_id)
 
-        save_prompt_states(prompts_dir, states)
+        if changed:
+            save_prompt_states(prompts_dir, states)
+        return changed
 
 
 def get_prompt_state(prompts_dir: str, bundle_id: str) -> dict[str, Any] | None:
@@ -244,3 +364,102 @@ def get_prompt_state(prompts_dir: str, bundle_id: str) -> dict[str, Any] | None:
     """
     states = load_prompt_states(prompts_dir)
     return states.get(bundle_id)
+
+
+# ============================================================================
+# Prompt Index (cached listing for GET /prompts)
+# ============================================================================
+
+def _file_stamp(path: str) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) for a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def load_prompt_index(prompts_dir: str) -> dict[str, list[dict[str, Any]]]:
+    """Load the rolling window enriched with used state, pre-sorted by timestamp.
+
+    Lists are also pre-split by used state, and each bundle carries a
+    lowercased "_search_blob" (id, setting, seed words, first 200 chars of
+    the image prompt, NUL-separated) so search is one substring test.
+
+    The index is cached in memory and rebuilt only when prompts.jsonl or
+    prompt_states.json changes on disk (mtime/size) or is written by this
+    process.
+
+    Args:
+        prompts_dir: Directory for prompts output
+
+    Returns:
+        Dict with:
+        {
+            "newest_first": [...],  # bundles sorted by timestamp, descending
+            "oldest_first": [...],  # bundles sorted by timestamp, ascending
+            "used_newest_first": [...], "used_oldest_first": [...],
+            "unused_newest_first": [...], "unused_oldest_first": [...],
+        }
+        Each bundle carries a "used" bool and a "_search_blob" str.
+
+    Note:
+        The returned lists and bundles are shared between callers; treat
+        them as read-only (copy before sorting or mutating).
+    """
+    global _prompt_index
+
+    path = get_prompts_file(prompts_dir)
+    states_file = get_states_file(prompts_dir)
+
+    with LOCK:
+        key = (prompts_dir, _file_stamp(path), _file_stamp(states_file))
+        cached = _prompt_index
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # Newest first (file order reversed), as read_all_prompts returns
+        entries = list(reversed(_load_window(path)))
+        states = load_prompt_states(prompts_dir)
+        for entry in entries:
+            state = states.get(entry.get("id", ""))
+            entry["used"] = state.get("used", False) if state else False
+            entry["_search_blob"] = "\x00".join([
+                entry.get("id", "").lower(),
+                entry.get("setting", "").lower(),
+                *(sw.lower() for sw in entry.get("seed_words", [])),
+                entry.get("image_prompt", {}).get("final_prompt", "").lower()[:200],
+            ])
+
+        newest = sorted(entries, key=lambda p: p.get("timestamp", ""), reverse=True)
+        oldest = sorted(entries, key=lambda p: p.get("timestamp", ""))
+        index = {
+            "newest_first": newest,
+            "oldest_first": oldest,
+            "used_newest_first": [p for p in newest if p["used"]],
+            "used_oldest_first": [p for p in oldest if p["used"]],
+            "unused_newest_first": [p for p in newest if not p["used"]],
+            "unused_oldest_first": [p for p in oldest if not p["used"]],
+        }
+        _prompt_index = (key, index)
+        return index
+
+
+def prompts_etag(prompts_dir: str) -> str:
+    """Return a weak ETag for the prompt list.
+
+    Derived from the (mtime_ns, size) stamps of prompts.jsonl and
+    prompt_states.json, so it changes whenever a bundle or used state is
+    written.
+
+    Args:
+        prompts_dir: Directory for prompts output
+
+    Returns:
+        Weak ETag string (e.g. 'W/"18a1f...-3e8-18a1f...-40"')
+    """
+    parts = []
+    for path in (get_prompts_file(prompts_dir), get_states_file(prompts_dir)):
+        stamp = _file_stamp(path)
+        parts.append(f"{stamp[0]:x}-{stamp[1]:x}" if stamp else "0")
+    return f'W/"{"-".join(parts)}"'
@@ -0,0 +1,98 @@
+"""In-process per-client rate limiting for API routes (token bucket).
+
+Each rate_limit(times, seconds) dependency owns a bucket per client IP that
+holds up to `times` tokens and refills at times/seconds tokens per second.
+Buckets are only touched from async dependencies on the event loop, so no
+locking is needed.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Awaitable, Callable
+
+from fastapi import HTTPException, Request
+
+# Prune idle buckets once a limiter tracks this many clients
+MAX_TRACKED_CLIENTS = 10_000
+
+
+def client_key(request: Request) -> str:
+    """Return the rate-limit key for a request (client IP).
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Client host, or "127.0.0.1" if unavailable
+    """
+    return request.client.host if request.client else "127.0.0.1"
+
+
+class TokenBucket:
+    """Lazily refilled token buckets keyed by client."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Create bucket set.
+
+        Args:
+            rate: Tokens refilled per second
+            burst: Bucket capacity (max requests in a burst)
+        """
+        self.rate = rate
+        self.burst = burst
+        self._buckets: dict[str, tuple[float, float]] = {}  # key -> (tokens, last)
+
+    def try_acquire(self, key: str) -> bool:
+        """Take one token for key if available.
+
+        Args:
+            key: Client key
+
+        Returns:
+            True if the request is allowed, False if rate limited
+        """
+        now = time.monotonic()
+        tokens, last = self._buckets.get(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - last) * self.rate)
+
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            return False
+
+        if len(self._buckets) >= MAX_TRACKED_CLIENTS and key not in self._buckets:
+            self._prune(now)
+        self._buckets[key] = (tokens - 1, now)
+        return True
+
+    def _prune(self, now: float) -> None:
+        """Drop buckets that have refilled to capacity (idle clients)."""
+        full_after = self.burst / self.rate
+        self._buckets = {
+            k: v for k, v in self._buckets.items() if now - v[1] < full_after
+        }
+
+
+def rate_limit(times: int, seconds: float) -> Callable[[Request], Awaitable[None]]:
+    """Build a FastAPI dependency allowing `times` requests per `seconds` per client.
+
+    Usage:
+        @router.get("/items", dependencies=[Depends(rate_limit(60, 60))])
+
+    Args:
+        times: Requests allowed per window (also the burst size)
+        seconds: Window length in seconds
+
+    Returns:
+        Async dependency that raises HTTPException(429) when exceeded
+    """
+    bucket = TokenBucket(rate=times / seconds, burst=times)
+
+    async def dependency(request: Request) -> None:
+        if not bucket.try_acquire(client_key(request)):
+            raise HTTPException(
+                status_code=429,
+                detail=f"Rate limit exceeded: {times} per {seconds:g} seconds",
+            )
+
+    return dependency
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
 import os
 import threading
 from typing import Any
 
+import orjson
+
 LOCK = threading.Lock()
 
 
@@ -34,17 +35,18 @@ def safe_join(*parts: str) -> str:
 
 def _load(path: str) -> list[dict[str, Any]]:
     """Loads JSON array from file, returns empty list if file doesn't exist."""
-    if not os.path.exists(path):
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
         return []
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
 
 
 def _dump(path: str, data: list[dict[str, Any]]) -> None:
     """Atomically writes JSON array to file using temp + rename."""
     tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(tmp, "wb") as f:
+        f.write(orjson.dumps(data))
     os.replace(tmp, path)
 
 
@@ -11,20 +11,25 @@ Key improvements:
 from __future__ import annotations
 
 import hashlib
+import heapq
 import json
+import math
 import random
 import re
 import time
 from dataclasses import dataclass
 from decimal import Decimal
+from pathlib import Path
 from typing import Any
 
 from pydantic import ValidationError
 
 from app.core import concurrency
+from app.core.config_cache import load_json_cached
 from app.core.cost import add_cost
 from app.core.logging import log
 from app.core.paths import get_data_path
+from app.core.prompt_storage import read_recent_prompts
 
 from .models import ImagePrompt, MusicBrief, MotionSpec, PromptBundle, VideoPrompt
 from .text_filter import filter_banned_words
@@ -42,6 +47,9 @@ ACCESSORY_MAP = {
     "bag": r"(belt bag|waist pack|micro-?satchel|purse|backpack)",
 }
 
+# Compiled once; _acc_category runs for every accessory in every panel
+_ACCESSORY_RX = tuple((cat, re.compile(rx)) for cat, rx in ACCESSORY_MAP.items())
+
 # Binding policy for recency tracking (Twist removed)
 BIND_POLICY = {
     "scene": {"k": 1, "recent": 50},
@@ -88,8 +96,8 @@ SECTION_BUDGETS = {
 def _acc_category(text: str) -> str:
     """Categorize accessory by body location."""
     t = text.lower()
-    for cat, rx in ACCESSORY_MAP.items():
-        if re.search(rx, t):
+    for cat, rx in _ACCESSORY_RX:
+        if rx.search(t):
             return cat
     return "other"
 
@@ -206,6 +214,20 @@ def _phrase_match_loose(text: str, phrase: str, threshold: float = 0.8) -> bool:
 # Regex to match slot wrapper tags like <scene>[...], <camera>[...], etc.
 _TAG_BLOCK = re.compile(r"<[a-z_]+>\s*\[([^\]]+)\]", re.IGNORECASE)
 
+# Section labels stripped by _strip_section_labels, matched at start of
+# string or after period/newline, followed by "Label:" and whitespace
+_SECTION_LABELS = (
+    "Camera", "Angle", "Wardrobe", "Accessories", "Pose", "Lighting", "Environment", "Scene",
+)
+_SECTION_LABEL_PATTERNS = tuple(
+    (
+        label,
+        re.compile(r'(^|\.\s+|\n\s*)' + re.escape(label) + r':\s+', re.MULTILINE | re.IGNORECASE),
+    )
+    for label in _SECTION_LABELS
+)
+_MULTI_SPACE = re.compile(r'  +')
+
 
 def _strip_slot_wrappers(text: str) -> str:
     """
@@ -244,19 +266,10 @@ def _strip_section_labels(text: str) -> tuple[str, list[str]]:
     if not text:
         return text, []
 
-    # Section labels to strip
-    labels = ["Camera", "Angle", "Wardrobe", "Accessories", "Pose", "Lighting", "Environment", "Scene"]
     stripped = []
     cleaned = text
 
-    for label in labels:
-        # Match label at start of sentence or after period/newline
-        # Pattern: (start of string OR period/newline) + whitespace + Label: + whitespace
-        pattern = re.compile(
-            r'(^|\.\s+|\n\s*)' + re.escape(label) + r':\s+',
-            re.MULTILINE | re.IGNORECASE
-        )
-
+    for label, pattern in _SECTION_LABEL_PATTERNS:
         # Find matches to track what was stripped
         matches = pattern.findall(cleaned)
         if matches:
@@ -266,7 +279,7 @@ def _strip_section_labels(text: str) -> tuple[str, list[str]]:
         cleaned = pattern.sub(r'\1', cleaned)
 
     # Clean up any double spaces
-    cleaned = re.sub(r'  +', ' ', cleaned).strip()
+    cleaned = _MULTI_SPACE.sub(' ', cleaned).strip()
 
     return cleaned, stripped
 
@@ -575,39 +588,17 @@ class GrokClient:
             items = norm[:]
             rng.shuffle(items)
             return [t for t, _ in items]
-        # Weighted sampling without replacement
-        out = []
-        pool = norm[:]
-        for _ in range(k):
-            total_w = sum(w for _, w in pool)
-            r = rng.random() * total_w
-            acc = 0.0
-            idx = 0
-            for i, (t, w) in enumerate(pool):
-                acc += w
-                if acc >= r:
-                    idx = i
-                    break
-            t, _ = pool.pop(idx)
-            out.append(t)
-        return out
+        # Weighted sampling without replacement (Efraimidis-Spirakis):
+        # draw one key log(u)/w per item and keep the k largest, a single
+        # O(n log k) pass instead of re-summing the pool for every pick
+        top = heapq.nlargest(k, norm, key=lambda tw: math.log(1.0 - rng.random()) / tw[1])
+        return [t for t, _ in top]
 
     @staticmethod
     def _load_recent_prompts(limit: int = 100) -> list[dict[str, Any]]:
-        """Load recent prompt bundles from JSONL storage."""
+        """Load recent prompt bundles from JSONL storage (tail-read, newest first)."""
         try:
-            prompts_path = get_data_path("prompts/prompts.jsonl")
-            if not prompts_path.exists():
-                return []
-
-            recent = []
-            with open(prompts_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        recent.append(json.loads(line))
-
-            # Return most recent first
-            return recent[-limit:] if len(recent) > limit else recent
+            return read_recent_prompts(str(get_data_path("prompts")), limit=limit)
 
         except Exception as e:
             log.warning(f"Failed to load recent prompts: {e}")
@@ -641,14 +632,15 @@ class GrokClient:
         # Load recent prompts
         recent_bundles = self._load_recent_prompts(recent_window)
 
+        # Lowercase recent image prompts once into a single NUL-separated blob,
+        # so each panel item is one substring search instead of one per bundle
+        recent_blob = "\x00".join(
+            bundle.get("image_prompt", {}).get("final_prompt", "").lower()
+            for bundle in recent_bundles
+        )
+
         # Extract recently used items for this slot
-        recently_used = set()
-        for bundle in recent_bundles:
-            # Check image prompt for slot content
-            img_prompt = bundle.get("image_prompt", {}).get("final_prompt", "")
-            for item in panel:
-                if item.lower() in img_prompt.lower():
-                    recently_used.add(item)
+        recently_used = {item for item in panel if item.lower() in recent_blob}
 
         # Filter out recently used items
         available = [item for item in panel if item not in recently_used]
@@ -887,16 +879,14 @@ Create music brief. Return JSON:
     def _load_motion_bank() -> dict[str, list[dict[str, Any]]]:
         """Load video motion variety bank from variety_bank.json."""
         try:
-            variety_bank_path = get_data_path("variety_bank.json")
-            with open(variety_bank_path, "r", encoding="utf-8") as f:
-                full_bank = json.load(f)
-                # Extract only the video motion banks
-                return {
-                    "video_camera_motion": full_bank.get("video_camera_motion", []),
-                    "video_micro_action": full_bank.get("video_micro_action", []),
-                    "video_posture": full_bank.get("video_posture", []),
-                    "video_closing_angle": full_bank.get("video_closing_angle", []),
-                }
+            full_bank = load_json_cached(get_data_path("variety_bank.json"))
+            # Extract only the video motion banks
+            return {
+                "video_camera_motion": full_bank.get("video_camera_motion", []),
+                "video_micro_action": full_bank.get("video_micro_action", []),
+                "video_posture": full_bank.get("video_posture", []),
+                "video_closing_angle": full_bank.get("video_closing_angle", []),
+            }
         except FileNotFoundError:
             log.warning("variety_bank.json not found, returning empty motion banks")
             return {
@@ -990,18 +980,21 @@ Create music brief. Return JSON:
             "video_closing_angle": set(),
         }
 
-        for bundle in recent_bundles:
-            video = bundle.get("video_prompt", {})
-            if isinstance(video, dict) and "line" in video:
-                # Try to extract components from lines
-                line = video["line"]
-                # Simple heuristic extraction (best effort)
-                for slot_name in recently_used.keys():
-                    slot_bank = motion_bank.get(slot_name, [])
-                    for item in slot_bank:
-                        text = item.get("text", "") if isinstance(item, dict) else str(item)
-                        if text and text.lower() in line.lower():
-                            recently_used[slot_name].add(text)
+        # Lowercase recent motion lines once into a single NUL-separated blob
+        recent_lines = "\x00".join(
+            video["line"].lower()
+            for video in (bundle.get("video_prompt", {}) for bundle in recent_bundles)
+            if isinstance(video, dict) and "line" in video
+        )
+
+        # Simple heuristic extraction (best effort)
+        if recent_lines:
+            for slot_name in recently_used.keys():
+                slot_bank = motion_bank.get(slot_name, [])
+                for item in slot_bank:
+                    text = item.get("text", "") if isinstance(item, dict) else str(item)
+                    if text and text.lower() in recent_lines:
+                        recently_used[slot_name].add(text)
 
         # Try up to 3 times to generate a valid line
         for attempt in range(3):
@@ -1017,7 +1010,9 @@ Create music brief. Return JSON:
 
                 # Filter out recently used
                 recent_window = policy["recent"]
-                recent_for_slot = list(recently_used[slot_name])[-recent_window:]
+                recent_for_slot = recently_used[slot_name]
+                if len(recent_for_slot) > recent_window:
+                    recent_for_slot = set(list(recent_for_slot)[-recent_window:])
                 available = [
                     item for item in bank
                     if (item.get("text", "") if isinstance(item, dict) else str(item)) not in recent_for_slot
@@ -1115,17 +1110,12 @@ Create music brief. Return JSON:
 
         # Load persona and variety bank
         try:
-            persona_path = get_data_path("persona.json")
-            variety_path = get_data_path("variety_bank.json")
-            with open(persona_path, "r", encoding="utf-8") as f:
-                persona = json.load(f)
-            with open(variety_path, "r", encoding="utf-8") as f:
-                variety_bank = json.load(f)
+            persona = load_json_cached(get_data_path("persona.json"))
+            variety_bank = load_json_cached(get_data_path("variety_bank.json"))
         except (FileNotFoundError, json.JSONDecodeError) as e:
             raise RuntimeError(f"Failed to load config files: {e}") from e
 
         # Load scenes from location-specific JSON using provided path
-        from pathlib import Path
         location_file = Path(location_path)
 
         if not location_file.exists():
@@ -1133,10 +1123,9 @@ Create music brief. Return JSON:
             raise RuntimeError(f"Location file not found: {location_path}")
 
         try:
-            with open(location_file, "r", encoding="utf-8") as f:
-                location_data = json.load(f)
-                scenes = location_data.get("scenes", [])
-                log.info(f"GROK_BUNDLE loaded {len(scenes)} scenes from {location_file.name} (setting_id={setting_id})")
+            location_data = load_json_cached(location_file)
+            scenes = location_data.get("scenes", [])
+            log.info(f"GROK_BUNDLE loaded {len(scenes)} scenes from {location_file.name} (setting_id={setting_id})")
         except (FileNotFoundError, json.JSONDecodeError) as e:
             log.error(f"Failed to load location file {location_path}: {e}")
             raise RuntimeError(f"Failed to load scenes from {location_path}: {e}") from e
@@ -15,6 +15,12 @@ BANNED_WORDS = [
     "delicate",
 ]
 
+# Word-boundary, case-insensitive pattern per banned word (compiled once)
+_BANNED_PATTERNS = tuple(
+    re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE) for word in BANNED_WORDS
+)
+_WHITESPACE = re.compile(r'\s+')
+
 
 def filter_banned_words(text: str) -> tuple[str, list[str]]:
     """
@@ -32,11 +38,7 @@ def filter_banned_words(text: str) -> tuple[str, list[str]]:
     removed = []
     cleaned = text
 
-    for word in BANNED_WORDS:
-        # Build regex pattern to match word with word boundaries
-        # Case-insensitive, matches whole words only
-        pattern = re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE)
-
+    for pattern in _BANNED_PATTERNS:
         # Find all matches to track what was removed
         matches = pattern.findall(cleaned)
         if matches:
@@ -46,7 +48,7 @@ def filter_banned_words(text: str) -> tuple[str, list[str]]:
         cleaned = pattern.sub('', cleaned)
 
     # Clean up any double spaces, leading/trailing spaces
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+    cleaned = _WHITESPACE.sub(' ', cleaned).strip()
 
     # Remove duplicate entries from removed list
     removed = list(set(removed))
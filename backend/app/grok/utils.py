@@ -8,10 +8,11 @@ Provides:
 
 from __future__ import annotations
 
-import json
 from decimal import Decimal
 from typing import Any
 
+import orjson
+
 
 def extract_json(text: str) -> Any:
     """
@@ -37,8 +38,8 @@ def extract_json(text: str) -> Any:
         content = content.replace("```json", "").replace("```", "").strip()
 
     try:
-        return json.loads(content)
-    except json.JSONDecodeError as e:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError as e:
         # Provide truncated preview for debugging
         preview = content[:2000] + "..." if len(content) > 2000 else content
         raise ValueError(
@@ -4,20 +4,20 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, Request, Response
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 from app.api.routes import router
+from app.clients.provider_selector import prompting_client
+from app.core import concurrency
 from app.core.config import settings
 from app.core.logging import log
 from app.core.paths import get_data_path
-
-
-# Rate limiter
-limiter = Limiter(key_func=get_remote_address)
+from app.core.ratelimit import client_key
 
 
 @asynccontextmanager
@@ -25,6 +25,7 @@ async def lifespan(app: FastAPI):
     """Lifecycle manager for FastAPI app (Prompt Lab mode)."""
     # Startup
     log.info("PROMPT_LAB_STARTUP mode=prompt_generation_only")
+    concurrency.startup()
 
     # Ensure prompts output directory exists
     prompts_dir = Path(settings.prompts_out_dir)
@@ -34,13 +35,14 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
+    concurrency.shutdown()
+    if prompting_client.cache_info().currsize:
+        prompting_client().close()
+        prompting_client.cache_clear()
     log.info("PROMPT_LAB_SHUTDOWN")
 
 
-app = FastAPI(lifespan=lifespan)
-
-# Add rate limiter to app state
-app.state.limiter = limiter
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 # CORS middleware - restrict to localhost in development
@@ -51,6 +53,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Gzip larger JSON responses (prompt lists, bundles, log tails)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+@app.exception_handler(RequestValidationError)
+async def body_validation_exception_handler(request: Request, exc: RequestValidationError):
+    """Reports invalid JSON bodies as 400 with a string detail.
+
+    Query/path validation errors keep FastAPI's default 422 response.
+    """
+    body_errors = [e for e in exc.errors() if e.get("loc", ("",))[0] == "body"]
+    if not body_errors:
+        return await request_validation_exception_handler(request, exc)
+
+    detail = "; ".join(
+        f"{'.'.join(str(part) for part in e['loc'][1:]) or 'body'}: {e['msg']}"
+        for e in body_errors
+    )
+    return JSONResponse({"detail": f"Invalid request body: {detail}"}, status_code=400)
+
 
 @app.middleware("http")
 async def body_size_limit_middleware(request: Request, call_next):
@@ -61,7 +83,7 @@ async def body_size_limit_middleware(request: Request, call_next):
     """
     content_length = request.headers.get("content-length")
     if content_length and int(content_length) > 2_000_000:
-        log.warning(f"body_too_large client={get_remote_address(request)} size={content_length}")
+        log.warning(f"body_too_large client={client_key(request)} size={content_length}")
         return JSONResponse(
             {"error": "Payload too large (max 2MB)"},
             status_code=413,
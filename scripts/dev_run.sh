@@ -49,7 +49,7 @@ ROOT_DIR="$(cd "$SCRIPT_DIR/.." && pwd)"
 
 # Start backend
 cd "$ROOT_DIR/backend"
-uv run uvicorn app.main:app --reload --port $BACKEND_PORT --host 0.0.0.0 &
+uv run uvicorn app.main:app --reload --port $BACKEND_PORT --host 0.0.0.0 --loop uvloop --http httptools &
 PID1=$!
 
 # Start frontend
@@ -36,4 +36,4 @@ echo ""
 cd "$BACKEND_DIR"
 
 # Start FastAPI with uvicorn
-uv run uvicorn app.main:app --reload --port $PORT --host 0.0.0.0
+uv run uvicorn app.main:app --reload --port $PORT --host 0.0.0.0 --loop uvloop --http httptools